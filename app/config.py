@@ -1,17 +1,40 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+import hashlib
+import json
+import os
+import tempfile
+from dataclasses import dataclass, field, fields
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional, Tuple
 
+import fastjsonschema
 import yaml
 
+try:
+    # لودر C مبتنی بر LibYAML؛ اگر PyYAML بدون آن نصب شده باشد به لودر پایتونی برمی‌گردیم
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader  # type: ignore[assignment]
+
 
 BASE_DIR = Path(__file__).resolve().parent.parent
 CONFIG_PATH = BASE_DIR / "config" / "config.yaml"
+CONFIG_SCHEMA_PATH = BASE_DIR / "config" / "config.schema.json"
+
+_SCHEMA_BYTES = CONFIG_SCHEMA_PATH.read_bytes()
+
+# validator فقط یک بار هنگام import کامپایل می‌شود؛ خطاهای آن زیرکلاس ValueError هستند
+_VALIDATE = fastjsonschema.compile(json.loads(_SCHEMA_BYTES))
+
+# با هر تغییر در شکل کش یا منطق _build_config باید افزایش یابد
+_CACHE_FORMAT_VERSION = 2
+_SCHEMA_SHA256 = hashlib.sha256(_SCHEMA_BYTES).hexdigest()
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ApiConfig:
     name: str
     url: str
@@ -22,65 +45,147 @@ class ApiConfig:
     timeout_seconds: int
     target_url: Optional[str]
     enabled: bool = True
-    query_params: Optional[Dict[str, str]] = None  # ← پارامترهای داینامیک
+    # ← پارامترهای داینامیک؛ tuple از جفت‌ها تا ApiConfig فقط‌خواندنی و hashable بماند
+    query_params: Optional[Tuple[Tuple[str, str], ...]] = None
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class AppConfig:
-    apis: List[ApiConfig]
+    apis: Tuple[ApiConfig, ...]
+    # نگاشت name → ApiConfig برای lookup با O(1)
+    by_name: Mapping[str, ApiConfig] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        by_name: Dict[str, ApiConfig] = {}
+        for api in self.apis:
+            if api.name in by_name:
+                raise ValueError(f"Duplicate API name '{api.name}' in config.")
+            by_name[api.name] = api
+        object.__setattr__(self, "by_name", MappingProxyType(by_name))
+
+
+def _cache_path_for(path: Path) -> Path:
+    # config/config.yaml → config/.config.cache.json
+    return path.with_name(f".{path.stem}.cache.json")
+
+
+def _cache_header(mtime_ns: int, size: int) -> Dict[str, Any]:
+    # کش فقط وقتی معتبر است که فایل yaml، schema و نسخه‌ی فرمت کش همگی تغییر نکرده باشند
+    return {
+        "format_version": _CACHE_FORMAT_VERSION,
+        "source_mtime_ns": mtime_ns,
+        "source_size": size,
+        "schema_sha256": _SCHEMA_SHA256,
+    }
+
+
+def _read_cache(cache_path: Path, header: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """
+    خواندن نسخه‌ی JSON کش‌شده؛ اگر کش وجود نداشته باشد یا header آن با فایل yaml فعلی نخواند None برمی‌گرداند.
+    """
+    try:
+        cached = json.loads(cache_path.read_bytes())
+    except (OSError, ValueError):
+        return None
+
+    if not isinstance(cached, dict) or cached.get("header") != header:
+        return None
+
+    raw = cached.get("config")
+    return raw if isinstance(raw, dict) else None
+
+
+def _api_to_dict(api: ApiConfig) -> Dict[str, Any]:
+    data = {f.name: getattr(api, f.name) for f in fields(api)}
+    if api.query_params is not None:
+        data["query_params"] = dict(api.query_params)
+    return data
+
+
+def _write_cache(cache_path: Path, header: Dict[str, Any], config: AppConfig) -> None:
+    """
+    نوشتن اتمیک کانفیگ نرمال‌شده در فایل JSON کنار yaml (خطای نوشتن نادیده گرفته می‌شود).
+    """
+    document = {
+        "header": header,
+        "config": {"apis": [_api_to_dict(api) for api in config.apis]},
+    }
+    try:
+        fd, tmp_name = tempfile.mkstemp(
+            dir=cache_path.parent,
+            prefix=cache_path.name,
+            suffix=".tmp",
+        )
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(document, f, ensure_ascii=False)
+            os.replace(tmp_name, cache_path)
+        except BaseException:
+            os.unlink(tmp_name)
+            raise
+    except OSError:
+        pass
+
+
+def _build_config(raw: Dict[str, Any]) -> AppConfig:
+    # اعتبارسنجی کامل (و پر کردن مقادیر پیش‌فرض) با validator کامپایل‌شده‌ی schema؛
+    # "integer" در schema مقادیری مثل 10.0 را هم می‌پذیرد، پس فیلدهای عددی int می‌شوند
+    _VALIDATE(raw)
+
+    apis = tuple(
+        ApiConfig(
+            name=entry["name"],
+            url=entry["url"],
+            method=entry["method"].upper(),
+            interval_seconds=int(entry["interval_seconds"]),
+            max_retries=int(entry["max_retries"]),
+            retry_backoff_seconds=int(entry["retry_backoff_seconds"]),
+            timeout_seconds=int(entry["timeout_seconds"]),
+            target_url=entry["target_url"] or None,
+            enabled=entry["enabled"],
+            query_params=(
+                tuple((str(k), str(v)) for k, v in entry["query_params"].items())
+                if entry["query_params"] is not None
+                else None
+            ),
+        )
+        for entry in raw["apis"]
+    )
+
+    return AppConfig(apis=apis)
+
+
+@lru_cache(maxsize=8)
+def _load_config_cached(path_str: str, mtime_ns: int, size: int) -> AppConfig:
+    # نمونه‌های AppConfig بین فراخوانی‌ها به اشتراک گذاشته می‌شوند؛ نباید تغییرشان داد
+    path = Path(path_str)
+    cache_path = _cache_path_for(path)
+
+    # اگر header کش JSON با فایل yaml فعلی هم‌خوان باشد، پارس yaml را کامل رد می‌کنیم؛
+    # کش خراب یا قدیمی نادیده گرفته می‌شود و از روی yaml دوباره ساخته می‌شود
+    header = _cache_header(mtime_ns, size)
+    cached_raw = _read_cache(cache_path, header)
+    if cached_raw is not None:
+        try:
+            return _build_config(cached_raw)
+        except ValueError:
+            pass
+
+    raw = yaml.load(path.read_bytes(), Loader=_YamlLoader) or {}
+
+    config = _build_config(raw)
+    _write_cache(cache_path, header, config)
+    return config
 
 
 def load_config(path: Path = CONFIG_PATH) -> AppConfig:
-    if not path.exists():
-        raise FileNotFoundError(f"Config file not found: {path}")
-
-    with path.open("r", encoding="utf-8") as f:
-        raw = yaml.safe_load(f) or {}
-
-    apis_data = raw.get("apis")
-    if apis_data is None or not isinstance(apis_data, list):
-        raise ValueError("Config file must contain a top-level 'apis' list.")
-
-    apis: List[ApiConfig] = []
-
-    for entry in apis_data:
-        if not isinstance(entry, dict):
-            raise ValueError("Each item in 'apis' must be an object/dict.")
-
-        name = entry.get("name")
-        if not name:
-            raise ValueError("Each API config must have a 'name' field.")
-
-        url = entry.get("url")
-        if not url:
-            raise ValueError(f"API '{name}' must have a 'url' field.")
-
-        raw_query_params = entry.get("query_params")
-        query_params: Optional[Dict[str, str]] = None
-        if raw_query_params is not None:
-            if not isinstance(raw_query_params, dict):
-                raise ValueError(
-                    f"API '{name}' has invalid 'query_params' (must be an object/dict).",
-                )
-
-            query_params = {str(k): str(v) for k, v in raw_query_params.items()}
-
-        api = ApiConfig(
-            name=str(name),
-            url=str(url),
-            method=str(entry.get("method", "GET")).upper(),
-            interval_seconds=int(entry.get("interval_seconds", 60)),
-            max_retries=int(entry.get("max_retries", 3)),
-            retry_backoff_seconds=int(entry.get("retry_backoff_seconds", 5)),
-            timeout_seconds=int(entry.get("timeout_seconds", 10)),
-            target_url=str(entry["target_url"]) if entry.get("target_url") else None,
-            enabled=bool(entry.get("enabled", True)),
-            query_params=query_params,
-        )
+    # یک stat هم وجود فایل را بررسی می‌کند و هم mtime/size را برای کلید کش می‌دهد
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Config file not found: {path}") from None
 
-        apis.append(api)
+    return _load_config_cached(str(path), st.st_mtime_ns, st.st_size)
 
-    if not apis:
-        raise ValueError("No APIs configured in config.yaml.")
 
-    return AppConfig(apis=apis)
+load_config.cache_clear = _load_config_cached.cache_clear  # type: ignore[attr-defined]
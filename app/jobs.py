@@ -2,25 +2,58 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import random
+import time
 from datetime import datetime, timezone
-from typing import Any, Dict
+from typing import Any, Dict, Mapping, Tuple
 
 import httpx
+import orjson
 from fastapi import FastAPI
 
 from .config import ApiConfig, AppConfig
-from .process import PROCESSORS
+from .process import PROCESSORS, encode_json
 
 logger = logging.getLogger(__name__)
 
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+# سقف زمان برقراری اتصال؛ بقیه‌ی مراحل از timeout_seconds هر API پیروی می‌کنند
+_CONNECT_TIMEOUT_SECONDS = 5.0
+
+# سقف تأخیر نمایی بین retryها
+_MAX_BACKOFF_SECONDS = 60.0
+
+
+def _ns_to_datetime(ns: int | None) -> datetime | None:
+    if ns is None:
+        return None
+    return datetime.fromtimestamp(ns / 1e9, tz=timezone.utc)
+
+
+def _backoff_delay(backoff: float, attempt: int) -> float:
+    # backoff نمایی و کمی jitter تا retryهای jobها هم‌زمان روی upstream نریزند؛
+    # سقف فقط رشد نمایی را محدود می‌کند و هیچ‌وقت از backoff تنظیم‌شده کمتر نیست
+    delay = min(backoff * (2 ** (attempt - 1)), max(_MAX_BACKOFF_SECONDS, backoff))
+    return delay + random.uniform(0, 0.25 * delay)
+
 
 class ApiJobState:
     def __init__(self) -> None:
-        self.last_run: datetime | None = None
-        self.last_success: datetime | None = None
+        # زمان‌ها به صورت nanosecond ذخیره می‌شوند و فقط هنگام خواندن به datetime تبدیل می‌شوند
+        self.last_run_ns: int | None = None
+        self.last_success_ns: int | None = None
         self.last_error: str | None = None
         self.run_count: int = 0
 
+    @property
+    def last_run(self) -> datetime | None:
+        return _ns_to_datetime(self.last_run_ns)
+
+    @property
+    def last_success(self) -> datetime | None:
+        return _ns_to_datetime(self.last_success_ns)
+
 
 class JobManager:
     def __init__(self, app: FastAPI, config: AppConfig) -> None:
@@ -28,6 +61,16 @@ class JobManager:
         self._config = config
         self._tasks: Dict[str, asyncio.Task[Any]] = {}
         self._state: Dict[str, ApiJobState] = {}
+        self._stop_event = asyncio.Event()
+        self._get_processor = PROCESSORS.get
+        # شیء Timeout هر API یک بار ساخته و در همه‌ی درخواست‌ها استفاده می‌شود
+        self._timeouts: Dict[str, httpx.Timeout] = {
+            api.name: httpx.Timeout(
+                api.timeout_seconds,
+                connect=min(_CONNECT_TIMEOUT_SECONDS, api.timeout_seconds),
+            )
+            for api in config.apis
+        }
 
     @property
     def state(self) -> Dict[str, ApiJobState]:
@@ -37,6 +80,7 @@ class JobManager:
         """
         برای هر API فعال، یک job پس‌زمینه ایجاد می‌کند.
         """
+        self._stop_event.clear()
         for api in self._config.apis:
             if not api.enabled:
                 logger.info("API '%s' is disabled in config; skipping", api.name)
@@ -57,6 +101,8 @@ class JobManager:
         """
         همه jobها را متوقف می‌کند (در shutdown اپ).
         """
+        # jobهایی که منتظر interval بعدی‌اند با این event بیدار می‌شوند
+        self._stop_event.set()
         for task in self._tasks.values():
             task.cancel()
         for name, task in list(self._tasks.items()):
@@ -72,42 +118,49 @@ class JobManager:
         - fetch با retry
         - پردازش
         - ارسال به سرویس خارجی (اگر target_url تنظیم شده باشد)
-        - صبر تا interval بعدی
+        - صبر تا interval بعدی (یا تا درخواست stop)
         """
         client: httpx.AsyncClient = self._app.state.http_client
-        processor = PROCESSORS.get(api_config.name)
-        state = self._state[api_config.name]
+        # مقادیر ثابت هر job یک بار قبل از حلقه خوانده می‌شوند
+        name = api_config.name
+        processor = self._get_processor(name)
+        target_url = api_config.target_url
+        interval = api_config.interval_seconds
+        state = self._state[name]
 
         while True:
-            state.last_run = datetime.now(timezone.utc)
+            state.last_run_ns = time.time_ns()
             state.run_count += 1
 
             try:
-                logger.debug("Running job '%s'", api_config.name)
+                logger.debug("Running job '%s'", name)
                 data = await self._fetch_with_retry(client, api_config)
-                payload: Any = data
-                if processor:
-                    payload = processor(data)
+                content = processor(data) if processor else encode_json(data)
 
                 # ✔ در حالت تست: همیشه payload را در لاگ نمایش بده
-                logger.info(
-                    "Payload for API '%s' (background run): %s",
-                    api_config.name,
-                    payload,
-                )
+                if logger.isEnabledFor(logging.INFO):
+                    logger.info(
+                        "Payload for API '%s' (background run): %s",
+                        name,
+                        content.decode("utf-8"),
+                    )
 
                 # اگر بعداً target_url را تنظیم کنی، علاوه بر لاگ، ارسال هم انجام می‌شود
-                if api_config.target_url:
-                    await self._send_to_target(client, api_config, payload)
+                if target_url:
+                    await self._send_to_target(client, api_config, content)
 
-                state.last_success = datetime.now(timezone.utc)
+                state.last_success_ns = time.time_ns()
                 state.last_error = None
-                logger.info("Job '%s' completed successfully", api_config.name)
+                logger.info("Job '%s' completed successfully", name)
             except Exception as exc:  # noqa: BLE001
                 state.last_error = str(exc)
-                logger.exception("Job '%s' failed: %s", api_config.name, exc)
+                logger.exception("Job '%s' failed: %s", name, exc)
 
-            await asyncio.sleep(api_config.interval_seconds)
+            try:
+                await asyncio.wait_for(self._stop_event.wait(), timeout=interval)
+                break  # stop درخواست شده
+            except asyncio.TimeoutError:
+                pass
 
     async def _fetch_with_retry(
         self,
@@ -120,13 +173,14 @@ class JobManager:
         """
         last_error: Exception | None = None
 
-        # params = query_params از config + هر چیزی که در لحظه پاس داده شود
-        params: Dict[str, Any] | None = None
-        if api_config.query_params:
-            params = dict(api_config.query_params)
+        # params = query_params از config + هر چیزی که در لحظه پاس داده شود؛
+        # بدون extra_params همان tuple فقط‌خواندنی config بدون کپی استفاده می‌شود
+        base_params = api_config.query_params
+        params: Mapping[str, Any] | Tuple[Tuple[str, str], ...] | None
         if extra_params:
-            params = params or {}
-            params.update(extra_params)
+            params = {**dict(base_params), **extra_params} if base_params else extra_params
+        else:
+            params = base_params
 
         for attempt in range(1, api_config.max_retries + 1):
             try:
@@ -134,10 +188,10 @@ class JobManager:
                     method=api_config.method,
                     url=api_config.url,
                     params=params,
-                    timeout=api_config.timeout_seconds,
+                    timeout=self._timeouts[api_config.name],
                 )
                 response.raise_for_status()
-                return response.json()
+                return orjson.loads(response.content)
             except Exception as exc:  # noqa: BLE001
                 last_error = exc
                 logger.warning(
@@ -148,7 +202,9 @@ class JobManager:
                     exc,
                 )
                 if attempt < api_config.max_retries:
-                    await asyncio.sleep(api_config.retry_backoff_seconds)
+                    await asyncio.sleep(
+                        _backoff_delay(api_config.retry_backoff_seconds, attempt),
+                    )
 
         assert last_error is not None
         raise last_error
@@ -157,14 +213,15 @@ class JobManager:
         self,
         client: httpx.AsyncClient,
         api_config: ApiConfig,
-        payload: Any,
+        content: bytes,
     ) -> None:
         """
-        ارسال payload پردازش‌شده به سرویس خارجی.
+        ارسال payload پردازش‌شده (JSON سریال‌شده) به سرویس خارجی.
         """
         response = await client.post(
             api_config.target_url,
-            json=payload,
-            timeout=api_config.timeout_seconds,
+            content=content,
+            headers=_JSON_HEADERS,
+            timeout=self._timeouts[api_config.name],
         )
         response.raise_for_status()
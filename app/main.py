@@ -1,8 +1,9 @@
 from __future__ import annotations
 
+import asyncio
 import logging
+import time
 from contextlib import asynccontextmanager
-from datetime import datetime, timezone
 from typing import Any, Dict, List
 
 import httpx
@@ -12,7 +13,7 @@ from fastapi.responses import JSONResponse
 from .config import load_config
 from .jobs import JobManager
 from .models import ApiJobStatus
-from .process import PROCESSORS
+from .process import PROCESSORS, encode_json
 
 
 logger = logging.getLogger("findata")
@@ -21,7 +22,11 @@ logger = logging.getLogger("findata")
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     config = load_config()
-    http_client = httpx.AsyncClient()
+    # HTTP/2 برای multiplex شدن درخواست‌های همزمان jobها روی یک اتصال
+    http_client = httpx.AsyncClient(
+        http2=True,
+        limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+    )
     job_manager = JobManager(app, config)
 
     app.state.config = config  # type: ignore[attr-defined]
@@ -97,7 +102,7 @@ def create_app() -> FastAPI:
         config = request.app.state.config  # type: ignore[attr-defined]
         http_client: httpx.AsyncClient = request.app.state.http_client  # type: ignore[attr-defined]
 
-        api_cfg = next((a for a in config.apis if a.name == job_name), None)
+        api_cfg = config.by_name.get(job_name)
         if api_cfg is None:
             return JSONResponse(
                 status_code=404,
@@ -130,25 +135,23 @@ def create_app() -> FastAPI:
                 content={"error": str(exc)},
             )
 
-        payload: Any = data
         processor = PROCESSORS.get(api_cfg.name)
-        if processor:
-            payload = processor(data)
+        content = processor(data) if processor else encode_json(data)
 
-        logger.info(
-            "Payload for job '%s' (manual /run-once): %s",
-            job_name,
-            payload,
-        )
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Payload for job '%s' (manual /run-once): %s",
+                job_name,
+                content.decode("utf-8"),
+            )
 
         if api_cfg.target_url:
             try:
-                response = await http_client.post(
-                    api_cfg.target_url,
-                    json=payload,
-                    timeout=api_cfg.timeout_seconds,
+                await job_manager._send_to_target(  # type: ignore[attr-defined]
+                    http_client,
+                    api_cfg,
+                    content,
                 )
-                response.raise_for_status()
             except Exception as exc:  # noqa: BLE001
                 return JSONResponse(
                     status_code=502,
@@ -157,9 +160,9 @@ def create_app() -> FastAPI:
 
         state = job_manager.state.get(api_cfg.name)
         if state is not None:
-            now = datetime.now(timezone.utc)
-            state.last_run = now
-            state.last_success = now
+            now_ns = time.time_ns()
+            state.last_run_ns = now_ns
+            state.last_success_ns = now_ns
             state.last_error = None
             state.run_count += 1
 
@@ -177,22 +180,26 @@ def create_app() -> FastAPI:
         config = request.app.state.config  # type: ignore[attr-defined]
         http_client: httpx.AsyncClient = request.app.state.http_client  # type: ignore[attr-defined]
 
-        results: List[Dict[str, Any]] = []
+        enabled_apis = [api_cfg for api_cfg in config.apis if api_cfg.enabled]
 
-        for api_cfg in config.apis:
-            if not api_cfg.enabled:
-                continue
+        # همه‌ی fetchها مستقل‌اند؛ به صورت همزمان اجرا می‌شوند
+        outcomes = await asyncio.gather(
+            *(
+                job_manager._fetch_with_retry(http_client, api_cfg)  # type: ignore[attr-defined]
+                for api_cfg in enabled_apis
+            ),
+            return_exceptions=True,
+        )
 
-            try:
-                _ = await job_manager._fetch_with_retry(  # type: ignore[attr-defined]
-                    http_client,
-                    api_cfg,
-                )
-                status = "ok"
-                error_message: str | None = None
-            except Exception as exc:  # noqa: BLE001
+        results: List[Dict[str, Any]] = []
+
+        for api_cfg, outcome in zip(enabled_apis, outcomes):
+            if isinstance(outcome, BaseException):
                 status = "error"
-                error_message = str(exc)
+                error_message: str | None = str(outcome)
+            else:
+                status = "ok"
+                error_message = None
 
             results.append(
                 {
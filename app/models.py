@@ -40,10 +40,8 @@ class ProcessedFund(BaseModel):
 
     @classmethod
     def from_fipiran(cls, item: FundItem) -> "ProcessedFund":
-        main_site: Optional[str] = None
-        if item.website_address:
-            main_site = item.website_address[0]
-        return cls(
+        # FundItem قبلاً اعتبارسنجی شده؛ model_construct از اعتبارسنجی دوباره صرف‌نظر می‌کند
+        return cls.model_construct(
             reg_no=item.reg_no,
             name=item.name,
             fund_type=item.fund_type,
@@ -52,7 +50,7 @@ class ProcessedFund(BaseModel):
             net_asset=item.net_asset,
             date=item.date,
             manager=item.manager,
-            main_website=main_site,
+            main_website=item.website_address[0] if item.website_address else None,
         )
 
 
@@ -1,29 +1,42 @@
 from __future__ import annotations
 
 from datetime import datetime, timezone
-from typing import Any, Callable, Dict
+from types import MappingProxyType
+from typing import Any, Callable, Dict, List, Mapping
+
+import orjson
+from pydantic import TypeAdapter
 
 from .models import ExternalFundPayload, FundItem, ProcessedFund
 
 
-def process_fund_compare(data: Dict[str, Any]) -> Dict[str, Any]:
-    raw_items = data.get("items", [])
-    items: list[ProcessedFund] = []
+# adapter یک بار ساخته می‌شود تا کل لیست در یک فراخوانی در هسته‌ی pydantic اعتبارسنجی شود
+_FUND_ITEM_LIST_ADAPTER = TypeAdapter(List[FundItem])
+
 
-    for item_data in raw_items:
-        fund_item = FundItem.model_validate(item_data)
-        items.append(ProcessedFund.from_fipiran(fund_item))
+def encode_json(payload: Any) -> bytes:
+    # برای APIهایی که processor ندارند؛ داده‌ی خام را یک بار به JSON تبدیل می‌کند
+    return orjson.dumps(payload)
+
+
+def process_fund_compare(data: Dict[str, Any]) -> bytes:
+    raw_items = data.get("items", [])
+    fund_items = _FUND_ITEM_LIST_ADAPTER.validate_python(raw_items)
+    items = [ProcessedFund.from_fipiran(fund_item) for fund_item in fund_items]
 
     payload = ExternalFundPayload(
         source="fipiran_fundcompare",
         fetched_at=datetime.now(timezone.utc),
         items=items,
     )
-    return payload.model_dump(mode="json")
+    # سریال‌سازی مستقیم در هسته‌ی pydantic، بدون ساختن dict میانی
+    return payload.model_dump_json().encode("utf-8")
 
 
-ProcessorType = Callable[[Dict[str, Any]], Dict[str, Any]]
+ProcessorType = Callable[[Dict[str, Any]], bytes]
 
-PROCESSORS: Dict[str, ProcessorType] = {
-    "fund_compare": process_fund_compare,
-}
+PROCESSORS: Mapping[str, ProcessorType] = MappingProxyType(
+    {
+        "fund_compare": process_fund_compare,
+    },
+)
@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+from typing import Iterator
+
+import pytest
+
+from app.config import _cache_path_for, load_config
+
+
+CONFIG_YAML = """\
+apis:
+  - name: fund_compare
+    url: https://example.com/fundcompare
+    timeout_seconds: 10
+"""
+
+
+@pytest.fixture
+def config_path(tmp_path: Path) -> Iterator[Path]:
+    path = tmp_path / "config.yaml"
+    path.write_text(CONFIG_YAML, encoding="utf-8")
+    load_config.cache_clear()
+    yield path
+    load_config.cache_clear()
+
+
+def _set_cached_timeout(cache_path: Path, timeout: int) -> None:
+    document = json.loads(cache_path.read_bytes())
+    document["config"]["apis"][0]["timeout_seconds"] = timeout
+    cache_path.write_text(json.dumps(document), encoding="utf-8")
+
+
+def test_fresh_sidecar_is_used(config_path: Path) -> None:
+    load_config(config_path)
+    cache_path = _cache_path_for(config_path)
+    assert cache_path.exists()
+
+    _set_cached_timeout(cache_path, 999)
+    load_config.cache_clear()
+
+    assert load_config(config_path).apis[0].timeout_seconds == 999
+
+
+def test_stale_sidecar_is_rebuilt_from_yaml(config_path: Path) -> None:
+    load_config(config_path)
+    cache_path = _cache_path_for(config_path)
+    _set_cached_timeout(cache_path, 999)
+
+    # همان mtime ولی اندازه‌ی متفاوت (مثل کپی با cp -p)
+    st = config_path.stat()
+    config_path.write_text(CONFIG_YAML.replace("10", "120"), encoding="utf-8")
+    os.utime(config_path, ns=(st.st_atime_ns, st.st_mtime_ns))
+    load_config.cache_clear()
+
+    assert load_config(config_path).apis[0].timeout_seconds == 120
+    cached = json.loads(cache_path.read_bytes())
+    assert cached["config"]["apis"][0]["timeout_seconds"] == 120
+
+
+def test_schema_change_invalidates_sidecar(config_path: Path) -> None:
+    load_config(config_path)
+    cache_path = _cache_path_for(config_path)
+    _set_cached_timeout(cache_path, 999)
+
+    document = json.loads(cache_path.read_bytes())
+    document["header"]["schema_sha256"] = "0" * 64
+    cache_path.write_text(json.dumps(document), encoding="utf-8")
+    load_config.cache_clear()
+
+    assert load_config(config_path).apis[0].timeout_seconds == 10
+
+
+@pytest.mark.parametrize("content", ["{not json", '{"header": {}, "config": {"apis": []}}'])
+def test_corrupt_sidecar_falls_back_to_yaml(config_path: Path, content: str) -> None:
+    load_config(config_path)
+    cache_path = _cache_path_for(config_path)
+    document = json.loads(cache_path.read_bytes())
+
+    cache_path.write_text(content, encoding="utf-8")
+    load_config.cache_clear()
+    assert load_config(config_path).apis[0].timeout_seconds == 10
+
+    # header درست ولی محتوای نامعتبر
+    document["config"] = {"apis": []}
+    cache_path.write_text(json.dumps(document), encoding="utf-8")
+    load_config.cache_clear()
+    assert load_config(config_path).apis[0].timeout_seconds == 10
+    assert json.loads(cache_path.read_bytes())["config"]["apis"]